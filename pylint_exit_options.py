@@ -1,16 +1,10 @@
-#!/usr/local/bin/python3
+#!/usr/bin/env python3
 """
 The goal of this script to add a level of customization for exit handling for pylint
 """
-from __future__ import print_function
-
 import argparse
 import os
 import sys
-from abc import ABC, abstractmethod
-
-from bitarray import bitarray
-from pylint import lint
 
 # Exit values
 __FATAL__ = 1
@@ -22,49 +16,102 @@ __USAGE__ = 32
 __QUALITY__ = 64
 __SUPPRESS__ = 0
 
-
-class BaseHandler(ABC):
+# Bits of a pylint return code that map to an exit value
+_EXIT_VALUE_MASK = 0x3F
+
+# Bit position of each exit value in ExitCodeMutator's per-message lists
+_POSITIONS = {
+    __FATAL__: 0,
+    __ERROR__: 1,
+    __WARNING__: 2,
+    __REFACTOR__: 3,
+    __CONVENTION__: 4,
+    __USAGE__: 5
+}
+
+# '--exit-report' flag for each exit value
+_FLAG_TABLE = (
+    ('F', __FATAL__),
+    ('E', __ERROR__),
+    ('W', __WARNING__),
+    ('R', __REFACTOR__),
+    ('C', __CONVENTION__),
+    ('U', __USAGE__)
+)
+
+
+class BaseHandler:
     """Base argument handling class"""
 
     def __init__(self, namespace: argparse.Namespace):
         self._handle_cli_arg(namespace)
 
-    @abstractmethod
     def _handle_cli_arg(self, namespace):
-        """Abstract method to be implemented for argument handling"""
-        ...
+        """Method to be implemented by subclasses for argument handling"""
+        raise NotImplementedError
 
 
 class ExitCodeMutator(BaseHandler):
     """Class for handling pylint exit codes"""
-    exit_value_defaults = {
-        __FATAL__: (__FATAL__, 'fatal message issued', __FATAL__),
-        __ERROR__: (__ERROR__, 'error message issued', __ERROR__),
-        __WARNING__: (__WARNING__, 'warning message issued', __WARNING__),
-        __REFACTOR__: (__REFACTOR__, 're-factor message issued', __SUPPRESS__),
-        __CONVENTION__: (__CONVENTION__, 'convention message issued', __SUPPRESS__),
-        __USAGE__: (__USAGE__, 'usage error', __USAGE__)
-    }
-
-    def _decode(self, value: int) -> list:
-        """Decode the return code value into a bit array.
+    # Indexed by bit position of the exit code (fatal=0, error=1, ... usage=5)
+    exit_value_descriptions = [
+        'fatal message issued',
+        'error message issued',
+        'warning message issued',
+        're-factor message issued',
+        'convention message issued',
+        'usage error'
+    ]
+    exit_value_defaults = [__FATAL__, __ERROR__, __WARNING__, __SUPPRESS__, __SUPPRESS__, __USAGE__]
+
+    def __init__(self, namespace: argparse.Namespace):
+        # copy the class defaults so enforcement settings are not shared between instances
+        self.exit_value_defaults = list(type(self).exit_value_defaults)
+        self._decode_table = {}
+        super().__init__(namespace)
+        self._rebuild_decode_table()
+
+    def _decode_all(self, value: int) -> tuple:
+        """Decode the return code value into its raised messages, exit code and blocking messages in one pass.
 
         Args:
-            value(int): Return code from pylint command line.
+            value(int): Return code from pylint command line, already masked with _EXIT_VALUE_MASK.
 
         Returns:
-            list of raised exit codes.
+            tuple: (tuple of raised messages, exit code, tuple of blocking messages).  Results are stored in
+            the instance's decode table, so they are returned as tuples to keep them immutable.
 
         Example:
-            >>> self._decode(1)
-            [(1, 'fatal message issued', 1)]
-            >>> self._decode(2)
-            [(2, 'error message issued', 0)]
-            >>> self._decode(3)
-            [(1, 'fatal message issued', 1), (2, 'error message issued', 0)]
+            >>> self._decode_all(12)
+            (('warning message issued', 're-factor message issued'), 4, ('warning message issued',))
         """
-        return [self.exit_value_defaults[x[1]] for x in zip(bitarray(bin(value)[2:])[::-1], self.exit_value_defaults) if
-                x[0]]
+        decoded = self._decode_table.get(value)
+        if decoded is not None:
+            return decoded
+
+        messages = []
+        exit_code = 0
+        exit_messages = []
+        defaults = self.exit_value_defaults
+        descriptions = self.exit_value_descriptions
+        # no bits are set above value.bit_length(), so stop there instead of scanning every level
+        for position in range(value.bit_length()):
+            if (value >> position) & 1:
+                description = descriptions[position]
+                messages.append(description)
+                enforce = defaults[position]
+                if enforce:
+                    exit_code |= enforce
+                    exit_messages.append(description)
+        decoded = tuple(messages), exit_code, tuple(exit_messages)
+        self._decode_table[value] = decoded
+        return decoded
+
+    def _rebuild_decode_table(self):
+        """Precompute the decoded result for every possible pylint return code."""
+        self._decode_table.clear()
+        for value in range(_EXIT_VALUE_MASK + 1):
+            self._decode_all(value)
 
     def _get_messages(self, value: int) -> list:
         """Return a list of raised messages for a given pylint return code.
@@ -83,7 +130,7 @@ class ExitCodeMutator(BaseHandler):
             >>> self._get_messages(3)
             ['fatal message issued', 'error message issued']
         """
-        return [x[1] for x in self._decode(value)]
+        return list(self._decode_all(value & _EXIT_VALUE_MASK)[0])
 
     def _get_exit_code(self, value: int):
         """Return the exist code that should be returned.
@@ -104,10 +151,7 @@ class ExitCodeMutator(BaseHandler):
             >>> self._get_exit_code(12)
             4
         """
-        exit_codes = [x[2] for x in self._decode(value)]
-        if not exit_codes:
-            return 0
-        return sum(exit_codes)
+        return self._decode_all(value & _EXIT_VALUE_MASK)[1]
 
     def handle_exit_code(self, value: int) -> int:
         """
@@ -139,25 +183,30 @@ class ExitCodeMutator(BaseHandler):
             No fatal messages detected.  Exiting gracefully...
             0
         """
-        messages = self._get_messages(value)
-        exit_code = self._get_exit_code(value)
+        if not value:
+            return 0
 
+        messages, exit_code, exit_messages = self._decode_all(value & _EXIT_VALUE_MASK)
+
+        out = []
         if messages:
-            print('The following types of issues were found:' + os.linesep)
+            out.append('The following types of issues were found:' + os.linesep)
 
             for message in messages:
-                print("  - %s" % message)
+                out.append(f"  - {message}")
 
-            print('')
+            out.append('')
 
         if exit_code:
-            print('The following types of issues are blocking:' + os.linesep)
+            out.append('The following types of issues are blocking:' + os.linesep)
 
-            exit_messages = self._get_messages(exit_code)
             for exit_message in exit_messages:
-                print("  - %s" % exit_message)
+                out.append(f"  - {exit_message}")
+
+            out.append('')
 
-            print('')
+        if out:
+            sys.stdout.write('\n'.join(out) + '\n')
 
         return exit_code
 
@@ -172,26 +221,16 @@ class ExitCodeMutator(BaseHandler):
             arg_value_list = namespace.exit_report.split(',')
             self._set_report_arg_values(arg_value_list)
 
-    def _set_report_arg_values(self, arg_values: []):
+    def _set_report_arg_values(self, arg_values: list):
         """ Apply an enforcement setting
 
         Args:
             arg_values (List): A list of setting passed into the '--exit-report' option which can change which exit
             codes will be returned to cli
         """
-        check = {
-            'F': __FATAL__,
-            'E': __ERROR__,
-            'W': __WARNING__,
-            'R': __REFACTOR__,
-            'C': __CONVENTION__,
-            'U': __USAGE__
-        }
-        for key, value in check.items():
-            if key in arg_values:
-                self._apply_enforcement_setting(value, value)
-            else:
-                self._apply_enforcement_setting(value, __SUPPRESS__)
+        flags = frozenset(arg_values)
+        for flag, value in _FLAG_TABLE:
+            self._apply_enforcement_setting(value, value if flag in flags else __SUPPRESS__)
 
     def _apply_enforcement_setting(self, key: int, value: int):
         """ Apply an enforcement setting
@@ -202,12 +241,9 @@ class ExitCodeMutator(BaseHandler):
 
         """
 
-        # unpack the tuple so it can be modified
-        encoded, description, enforce = self.exit_value_defaults[key]
-        enforce = value  # set the element to True (error)
-
-        # repack it back into a tuple to match existing data type
-        self.exit_value_defaults[key] = encoded, description, enforce
+        self.exit_value_defaults[_POSITIONS[key]] = value
+        # drop decoded results made with the old setting, they are decoded again on next use
+        self._decode_table.clear()
 
 
 class QualityCheck(BaseHandler):
@@ -265,6 +301,8 @@ def parse_args():
 def main():
     """ main function """
     args, remaining_args = parse_args()
+    # imported late so that '--help' and argument errors don't pay for pylint's start up
+    from pylint import lint  # pylint: disable=import-outside-toplevel
     run = lint.Run(remaining_args, do_exit=False)
     if run:
         ex = ExitCodeMutator(args)
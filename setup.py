@@ -1,5 +1,36 @@
-#!/usr/bin/python
-from setuptools import setup
+#!/usr/bin/env python3
+import os
+
+from setuptools import Extension, setup
+from setuptools.command.build_ext import build_ext
+
+
+class CythonBuildExt(build_ext):
+    """build_ext that cythonizes the extension sources only when the extension is actually built"""
+
+    def finalize_options(self):
+        from Cython.Build import cythonize  # pylint: disable=import-outside-toplevel
+        self.distribution.ext_modules = cythonize(self.distribution.ext_modules, build_dir='build',
+                                                  language_level=3)
+        super().finalize_options()
+
+
+# Set PYLINT_EXIT_OPTIONS_CYTHON=1 to compile the module with Cython.  The plain python module is installed
+# otherwise, and is still used if the optional extension fails to build.
+if os.environ.get('PYLINT_EXIT_OPTIONS_CYTHON') == '1':
+    build_options = {
+        'ext_modules': [Extension('pylint_exit_options', ['pylint_exit_options.py'], optional=True)],
+        'cmdclass': {'build_ext': CythonBuildExt},
+        'setup_requires': ['setuptools', 'wheel', 'Cython'],
+        'options': {}
+    }
+else:
+    build_options = {
+        'setup_requires': ['setuptools', 'wheel'],
+        'options': {
+            'bdist_wheel': {'universal': True}
+        }
+    }
 
 setup(
     name='pylint-exit-options',
@@ -8,15 +39,12 @@ setup(
     author='Lowell-Farrell',
     author_email='lff.dev19@gmail.com',
     py_modules=['pylint_exit_options'],
-    setup_requires=['setuptools', 'wheel', 'm2r'],
     tests_require=[],
-    install_requires=['bitarray', 'pylint'],
+    install_requires=['pylint'],
     data_files=[],
-    options={
-        'bdist_wheel': {'universal': True}
-    },
     url='https://github.com/lowellfarrell/pylint-exit-options',
     entry_points={
         'console_scripts': ['pylint-exit-options=pylint_exit_opitons:main'],
-    }
+    },
+    **build_options
 )